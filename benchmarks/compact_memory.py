@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""tracemalloc benchmark: resident memory of a portfolio of assessments.
+
+Compares the repo's plain in-memory form (a ResponseSet of Answer objects
+per operator, as held by PortfolioAnalytics) against CompactLibrary +
+CompactPortfolio. Answers, including their free text, are generated inside
+each traced region so both sides pay for the strings they keep.
+
+Per-operator cost of the plain form is constant, so it is measured on a
+sample of operators and scaled linearly; the compact form is measured at
+the full portfolio size.
+
+Usage: python3 benchmarks/compact_memory.py [OPERATORS] [BASELINE_SAMPLE]
+"""
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aml_risk.compact import CompactLibrary, CompactPortfolio  # noqa: E402
+from aml_risk.library import load_risks  # noqa: E402
+from aml_risk.responses import (  # noqa: E402
+    MITIGATION_SOURCES,
+    RESPONSE_OPTIONS,
+    SOURCED_OPTIONS,
+    Answer,
+    ResponseSet,
+)
+
+
+def make_answers(risks, operators, seed=2023):
+    """Synthetic response sets: every risk answered, ~5% with free text."""
+    rng = random.Random(seed)
+    options = list(RESPONSE_OPTIONS)
+    for operator in range(operators):
+        answers = []
+        for risk in risks:
+            option = rng.choice(options)
+            source = rng.choice(MITIGATION_SOURCES) if option in SOURCED_OPTIONS else None
+            text = f"Control note {operator}-{risk.risk_id}" if rng.random() < 0.05 else ""
+            answers.append(Answer(risk.risk_id, option, source, text))
+        yield f"OP-{operator:05d}", answers
+
+
+def build_plain(operators):
+    risks = load_risks()
+    portfolio = {}
+    for operator_id, answers in make_answers(risks, operators):
+        portfolio[operator_id] = ResponseSet(
+            operator_id, {answer.risk_id: answer for answer in answers}
+        )
+    return risks, portfolio
+
+
+def build_compact(operators):
+    risks = load_risks()
+    portfolio = CompactPortfolio(CompactLibrary(risks))
+    for operator_id, answers in make_answers(risks, operators):
+        for answer in answers:
+            portfolio.record_answer(operator_id, answer)
+    return portfolio
+
+
+def measure(build, *args):
+    tracemalloc.start()
+    result = build(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    operators = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    sample = min(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000, operators)
+
+    plain_bytes = measure(build_plain, sample) * operators / sample
+    compact_bytes = measure(build_compact, operators)
+    mib = 2 ** 20
+    print(f"Operators:        {operators:,}")
+    note = "" if sample == operators else f"  (measured on {sample:,}, scaled)"
+    print(f"ResponseSet form: {plain_bytes / mib:10.1f} MiB{note}")
+    print(f"Compact:          {compact_bytes / mib:10.1f} MiB")
+    print(f"Reduction:        {plain_bytes / compact_bytes:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""AML risk assessment library for the UK gambling sectors."""
+
+from .analytics import PortfolioAnalytics
+from .compact import CompactLibrary, CompactPortfolio
+from .controls import DEFAULT_CONTROLS, Control, CoverageMatrix
+from .library import Risk, filter_risks, load_risks, parse_risk_id
+from .responses import RESPONSE_OPTIONS, Answer, ResponseSet, residual_rating
+
+__all__ = [
+    "Answer",
+    "CompactLibrary",
+    "CompactPortfolio",
+    "Control",
+    "CoverageMatrix",
+    "DEFAULT_CONTROLS",
+    "PortfolioAnalytics",
+    "RESPONSE_OPTIONS",
+    "ResponseSet",
+    "Risk",
+    "filter_risks",
+    "load_risks",
+    "parse_risk_id",
+    "residual_rating",
+]
@@ -0,0 +1,150 @@
+"""Portfolio-wide analytics over stored assessments.
+
+Every answer write updates a set of rollup tables (per RiskID, per sector
+prefix, per response option and per residual rating), so dashboard queries
+read precomputed aggregates instead of scanning each operator's responses.
+"""
+
+from collections import Counter, defaultdict
+
+from .library import check_filters
+from .responses import RESPONSE_OPTIONS, Answer, ResponseSet, residual_rating
+
+# Tracker risks matching the vulnerabilities in the UKGC 2023 terrorist
+# financing assessment (docs/UKGC 2023 RA/TF): MSBs, mule accounts,
+# cryptoassets, pre-paid cards, cash and international terrorism
+# (high-risk jurisdictions). The generic "failing to comply with ML/TF
+# legislation" rows are general AML compliance and are left out.
+TF_RISK_IDS = frozenset({
+    "RC-MP-005", "NRC-MP-002",  # MSBs
+    "RC-CV-010", "RBet-CV-006",  # mule accounts
+    "RB-MP-001", "RC-MP-002", "RBet-MP-002", "NRC-MP-003",  # cryptoassets
+    "RB-MP-002", "RC-MP-003", "RBet-MP-003",  # pre-paid cards
+    "NRB-MP-001", "SL-MP-001", "AGC-MP-001", "FEC-MP-001",  # cash
+    "NRC-MP-001", "OCB-MP-001", "ONC-MP-001",
+    "RC-GV-001", "NRC-GV-001", "RBet-CV-003",  # high-risk jurisdictions
+})
+
+
+class PortfolioAnalytics:
+    """Store of operators' response sets with incrementally maintained rollups."""
+
+    def __init__(self, risks, tf_risk_ids=TF_RISK_IDS):
+        """tf_risk_ids classifies which RiskIDs are terrorist financing risks."""
+        self.risks = {risk.risk_id: risk for risk in risks}
+        # risk_id -> (sector prefix, inherent rating, terrorist financing),
+        # parsed once so answer writes never touch the RiskID regexes
+        self._risk_keys = {
+            risk_id: (risk.sector_prefix, risk.rating, risk_id in tf_risk_ids)
+            for risk_id, risk in self.risks.items()
+        }
+        self.response_sets = {}
+        # option -> Counter(risk_id)
+        self.by_risk = defaultdict(Counter)
+        # (option, sector prefix) -> Counter(risk_id)
+        self.by_sector_risk = defaultdict(Counter)
+        # sector prefix -> Counter(option)
+        self.by_sector = defaultdict(Counter)
+        self.by_option = Counter()
+        # residual rating -> sector prefix -> risk_id -> operator ids
+        self.residual = defaultdict(lambda: defaultdict(dict))
+
+    def record_answer(self, operator_id, answer):
+        """Store an answer, replacing any earlier answer to the same risk."""
+        if not isinstance(answer, Answer):
+            raise TypeError("answer must be an Answer")
+        if answer.risk_id not in self.risks:
+            raise KeyError(f"Unknown RiskID: {answer.risk_id}")
+        response_set = self.response_sets.setdefault(
+            operator_id, ResponseSet(operator_id)
+        )
+        previous = response_set.answers.get(answer.risk_id)
+        if previous is not None:
+            self._apply(operator_id, previous, -1)
+        response_set.answers[answer.risk_id] = answer
+        self._apply(operator_id, answer, +1)
+
+    def remove_answer(self, operator_id, risk_id):
+        """Delete one stored answer and its contribution to the rollups."""
+        response_set = self.response_sets.get(operator_id)
+        if response_set is None or risk_id not in response_set.answers:
+            raise KeyError(f"No answer for {risk_id} from {operator_id}")
+        self._apply(operator_id, response_set.answers.pop(risk_id), -1)
+
+    def remove_operator(self, operator_id):
+        """Delete an operator's whole response set from the store and rollups."""
+        if operator_id not in self.response_sets:
+            raise KeyError(f"No response set for {operator_id}")
+        response_set = self.response_sets.pop(operator_id)
+        for answer in response_set.answers.values():
+            self._apply(operator_id, answer, -1)
+
+    def _apply(self, operator_id, answer, delta):
+        risk_id, option = answer.risk_id, answer.option
+        prefix, inherent, _ = self._risk_keys[risk_id]
+        _bump(self.by_risk[option], risk_id, delta)
+        _bump(self.by_sector_risk[option, prefix], risk_id, delta)
+        _bump(self.by_sector[prefix], option, delta)
+        _bump(self.by_option, option, delta)
+
+        rating = residual_rating(inherent, option)
+        by_prefix = self.residual[rating]
+        by_risk = by_prefix[prefix]
+        if delta > 0:
+            by_risk.setdefault(risk_id, set()).add(operator_id)
+            return
+        operators = by_risk[risk_id]
+        operators.discard(operator_id)
+        if not operators:
+            del by_risk[risk_id]
+            if not by_risk:
+                del by_prefix[prefix]
+                if not by_prefix:
+                    del self.residual[rating]
+
+    def option_counts(self, sector_prefix=None):
+        """Answer counts per response option, optionally for one sector."""
+        check_filters(sector_prefix)
+        if sector_prefix is None:
+            return Counter(self.by_option)
+        return Counter(self.by_sector.get(sector_prefix, {}))
+
+    def most_common_risks(self, option, n=10, sector_prefix=None):
+        """RiskIDs most often given the option, as (risk_id, count) pairs."""
+        if option not in RESPONSE_OPTIONS:
+            raise ValueError(f"Unknown response option: {option!r}")
+        check_filters(sector_prefix)
+        if sector_prefix is None:
+            counts = self.by_risk.get(option)
+        else:
+            counts = self.by_sector_risk.get((option, sector_prefix))
+        return counts.most_common(n) if counts else []
+
+    def operators_with_residual(self, rating="High", sector_prefix=None,
+                                terrorist_financing=False):
+        """Operators holding at least one risk at the given residual rating.
+
+        With terrorist_financing, only risks in the TF classification passed
+        to the constructor count. Returns a dict of operator id -> sorted
+        RiskIDs at that rating.
+        """
+        check_filters(sector_prefix, rating)
+        by_prefix = self.residual.get(rating, {})
+        if sector_prefix is not None:
+            buckets = [by_prefix.get(sector_prefix, {})]
+        else:
+            buckets = by_prefix.values()
+        operators = defaultdict(list)
+        for by_risk in buckets:
+            for risk_id, operator_ids in by_risk.items():
+                if terrorist_financing and not self._risk_keys[risk_id][2]:
+                    continue
+                for operator_id in operator_ids:
+                    operators[operator_id].append(risk_id)
+        return {op: sorted(ids) for op, ids in sorted(operators.items())}
+
+
+def _bump(counter, key, delta):
+    counter[key] += delta
+    if counter[key] <= 0:
+        del counter[key]
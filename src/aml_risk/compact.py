@@ -0,0 +1,203 @@
+"""Memory-compact representation of the risk library and stored responses.
+
+Repeated strings (sectors, source references, titles, descriptions) are
+interned into integer-coded tables and risk records become parallel typed
+arrays indexed by risk ordinal. Each operator's response set is a
+bit-packed array: one nibble per risk for the response option and two bits
+per risk for the mitigation source. Free-text descriptions, which are rare
+and unique, are kept in a small side dict.
+"""
+
+from array import array
+
+from .library import Risk, parse_risk_id
+from .responses import MITIGATION_SOURCES, RESPONSE_OPTIONS, Answer
+
+# Code 0 means "not answered"
+_OPTION_CODES = {option: code for code, option in enumerate(RESPONSE_OPTIONS, 1)}
+_OPTIONS = (None, *RESPONSE_OPTIONS)
+_SOURCE_CODES = {source: code for code, source in enumerate(MITIGATION_SOURCES, 1)}
+_SOURCES = (None, *MITIGATION_SOURCES)
+
+
+class StringTable:
+    """Interns strings to dense integer codes."""
+
+    def __init__(self):
+        self._codes = {}
+        self._strings = []
+
+    def __len__(self):
+        return len(self._strings)
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def find(self, value):
+        """Code for an already-interned string, or None."""
+        return self._codes.get(value)
+
+    def __getitem__(self, code):
+        return self._strings[code]
+
+
+class CompactLibrary:
+    """Risk records stored as integer-coded columns indexed by ordinal."""
+
+    def __init__(self, risks):
+        # Titles and descriptions grow with the library; labels (sector
+        # prefix, category, sectors, source) stay few. Separate tables keep
+        # label codes small whatever the library size.
+        self.text = StringTable()
+        self.labels = StringTable()
+        self.risk_ids = []
+        self._ordinals = {}
+        self.prefix = array("I")
+        self.category = array("I")
+        self.number = array("I")
+        self.title = array("I")
+        self.description = array("I")
+        self.sectors = array("I")
+        self.source = array("I")
+        text, label = self.text.code, self.labels.code
+        for risk in risks:
+            if risk.risk_id in self._ordinals:
+                raise ValueError(f"Duplicate RiskID: {risk.risk_id}")
+            prefix, category, number = parse_risk_id(risk.risk_id)
+            self._ordinals[risk.risk_id] = len(self.risk_ids)
+            self.risk_ids.append(risk.risk_id)
+            self.prefix.append(label(prefix))
+            self.category.append(label(category))
+            self.number.append(number)
+            self.title.append(text(risk.title))
+            self.description.append(text(risk.description))
+            self.sectors.append(label(risk.applicable_sectors))
+            self.source.append(label(risk.source_reference))
+
+    def __len__(self):
+        return len(self.risk_ids)
+
+    def ordinal(self, risk_id):
+        return self._ordinals[risk_id]
+
+    def risk(self, ordinal):
+        """Rebuild the Risk record at an ordinal."""
+        text, labels = self.text, self.labels
+        return Risk(
+            risk_id=self.risk_ids[ordinal],
+            title=text[self.title[ordinal]],
+            description=text[self.description[ordinal]],
+            applicable_sectors=labels[self.sectors[ordinal]],
+            source_reference=labels[self.source[ordinal]],
+        )
+
+    def ordinals_for_prefix(self, sector_prefix):
+        code = self.labels.find(sector_prefix)
+        return [i for i, c in enumerate(self.prefix) if c == code]
+
+
+class PackedResponses:
+    """One operator's answers, bit-packed by risk ordinal."""
+
+    __slots__ = ("options", "sources", "descriptions")
+
+    def __init__(self, n_risks):
+        self.options = bytearray((n_risks + 1) // 2)
+        self.sources = bytearray((n_risks + 3) // 4)
+        self.descriptions = None
+
+    def get(self, ordinal):
+        """(option, mitigation_source, description) or None if unanswered."""
+        option = (self.options[ordinal >> 1] >> ((ordinal & 1) << 2)) & 0xF
+        if not option:
+            return None
+        source = (self.sources[ordinal >> 2] >> ((ordinal & 3) << 1)) & 0x3
+        description = self.descriptions.get(ordinal, "") if self.descriptions else ""
+        return _OPTIONS[option], _SOURCES[source], description
+
+    def set(self, ordinal, option, source=None, description=""):
+        source_code = 0 if source is None else _SOURCE_CODES[source]
+        self._put(ordinal, _OPTION_CODES[option], source_code)
+        if description:
+            if self.descriptions is None:
+                self.descriptions = {}
+            self.descriptions[ordinal] = description
+        elif self.descriptions:
+            self.descriptions.pop(ordinal, None)
+
+    def clear(self, ordinal):
+        self._put(ordinal, 0, 0)
+        if self.descriptions:
+            self.descriptions.pop(ordinal, None)
+
+    def _put(self, ordinal, option_code, source_code):
+        shift = (ordinal & 1) << 2
+        byte = ordinal >> 1
+        self.options[byte] = (self.options[byte] & ~(0xF << shift)) | (option_code << shift)
+        shift = (ordinal & 3) << 1
+        byte = ordinal >> 2
+        self.sources[byte] = (self.sources[byte] & ~(0x3 << shift)) | (source_code << shift)
+
+    def answered(self):
+        """Ordinals with an answer, ascending."""
+        for byte, packed in enumerate(self.options):
+            if packed & 0x0F:
+                yield byte << 1
+            if packed & 0xF0:
+                yield (byte << 1) | 1
+
+
+class CompactPortfolio:
+    """Many operators' response sets sharing one CompactLibrary."""
+
+    def __init__(self, library):
+        self.library = library
+        self.responses = {}
+
+    def record_answer(self, operator_id, answer):
+        """Store an answer, replacing any earlier answer to the same risk."""
+        if not isinstance(answer, Answer):
+            raise TypeError("answer must be an Answer")
+        ordinal = self.library.ordinal(answer.risk_id)
+        packed = self.responses.get(operator_id)
+        if packed is None:
+            packed = self.responses[operator_id] = PackedResponses(len(self.library))
+        packed.set(ordinal, answer.option, answer.mitigation_source, answer.description)
+
+    def answer(self, operator_id, risk_id):
+        """The stored Answer, or None if the operator has not answered."""
+        packed = self.responses.get(operator_id)
+        if packed is None:
+            return None
+        value = packed.get(self.library.ordinal(risk_id))
+        if value is None:
+            return None
+        option, source, description = value
+        return Answer(risk_id, option, source, description)
+
+    def answers(self, operator_id):
+        """Stored Answers in ordinal order; none for an unknown operator."""
+        packed = self.responses.get(operator_id)
+        if packed is None:
+            return
+        for ordinal in packed.answered():
+            option, source, description = packed.get(ordinal)
+            yield Answer(self.library.risk_ids[ordinal], option, source, description)
+
+    def remove_answer(self, operator_id, risk_id):
+        """Delete one stored answer."""
+        packed = self.responses.get(operator_id)
+        ordinal = self.library.ordinal(risk_id)
+        if packed is None or packed.get(ordinal) is None:
+            raise KeyError(f"No answer for {risk_id} from {operator_id}")
+        packed.clear(ordinal)
+
+    def remove_operator(self, operator_id):
+        """Delete an operator's whole response set."""
+        if operator_id not in self.responses:
+            raise KeyError(f"No response set for {operator_id}")
+        del self.responses[operator_id]
@@ -0,0 +1,254 @@
+"""Controls catalogue and risk x control coverage matrix.
+
+The same operator controls (KYC, source of funds checks, multiple-account
+detection, ...) mitigate risks across every sector. Coverage is held as a
+sparse boolean matrix (rows = risks, columns = controls) so that failure
+analysis and control-set selection stay cheap for large libraries.
+"""
+
+import heapq
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from .library import check_filters
+from .sparse import SparseBoolMatrix
+
+
+@dataclass(frozen=True)
+class Control:
+    """An operator control that can mitigate one or more risks."""
+
+    control_id: str
+    name: str
+    description: str
+    keywords: tuple = ()
+    _pattern: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_pattern", _keyword_pattern(self.keywords))
+
+    def matches(self, text):
+        """True if any keyword occurs as a word in lowercased risk text."""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+
+def _keyword_pattern(keywords):
+    """Word-anchored alternation of keywords.
+
+    Plain keywords match whole words (plus a plural "s"/"es"); a trailing
+    "*" marks a stem that matches as a word prefix, e.g. "structur*".
+    """
+    if not keywords:
+        return None
+    parts = []
+    for keyword in keywords:
+        if keyword.endswith("*"):
+            parts.append(re.escape(keyword[:-1]))
+        else:
+            parts.append(re.escape(keyword) + r"(?:s|es)?\b")
+    return re.compile(r"\b(?:" + "|".join(parts) + ")")
+
+
+def risk_text(risk):
+    """Lowercased title and description, as matched by Control keywords."""
+    return f"{risk.title} {risk.description}".lower()
+
+
+DEFAULT_CONTROLS = (
+    Control(
+        "CTL-KYC", "Customer due diligence (KYC)",
+        "Identity verification and ongoing customer due diligence.",
+        ("kyc", "know your customer", "identity", "identification", "id check",
+         "documentation", "false or stolen", "not physically present",
+         "anonymous", "unverified", "mule", "due diligence",
+         "business customer"),
+    ),
+    Control(
+        "CTL-SOF", "Source of funds and wealth checks",
+        "Verification of the origin of customer funds and wealth.",
+        ("source of funds", "source of wealth", "criminally derived",
+         "high value", "high-stakes", "high monetary", "proceeds"),
+    ),
+    Control(
+        "CTL-MAD", "Multiple-account detection",
+        "Detection of linked or duplicate accounts within and across operators.",
+        ("multiple remote", "multiple premises", "multiple accounts",
+         "fragment*", "smurfing", "mule", "inter-customer", "peer to peer",
+         "peer-to-peer"),
+    ),
+    Control(
+        "CTL-TXM", "Transaction monitoring",
+        "Monitoring of deposits, stakes and withdrawals for unusual patterns.",
+        ("transaction", "cash", "notes", "tito", "atr", "cashless",
+         "structur*", "smurfing", "threshold", "gaming machine", "ssbt"),
+    ),
+    Control(
+        "CTL-PAY", "Payment method controls",
+        "Closed-loop payments and restrictions on higher-risk payment methods.",
+        ("payment", "pre-paid", "prepaid", "e-wallet", "crypto*", "closed loop",
+         "card"),
+    ),
+    Control(
+        "CTL-TPD", "Third-party due diligence",
+        "Due diligence on business relationships, agents and suppliers.",
+        ("third party", "third-party", "business relationship", "investor",
+         "white label", "agent", "organised crime", "organized crime",
+         "organised criminal", "ownership", "acquisition", "payment provider",
+         "msb"),
+    ),
+    Control(
+        "CTL-PRD", "Product and terminal controls",
+        "Supervision and limits on higher-risk products and self-service terminals.",
+        ("byod", "terminal", "privacy booth", "instant win", "scratch card",
+         "gaming machine", "tito", "ssbt"),
+    ),
+    Control(
+        "CTL-PEP", "PEP and sanctions screening",
+        "Screening customers against PEP and sanctions lists.",
+        ("pep", "politically exposed", "sanction*"),
+    ),
+    Control(
+        "CTL-GEO", "Geographic risk controls",
+        "Restrictions and enhanced checks for high-risk jurisdictions.",
+        ("jurisdiction", "geograph*", "foreign"),
+    ),
+    Control(
+        "CTL-STF", "Staff vetting and training",
+        "Employee screening, competence and AML awareness training.",
+        ("staff", "employee", "personnel", "collusion", "competenc*",
+         "customer interaction", "self-staking"),
+    ),
+    Control(
+        "CTL-GOV", "AML governance and compliance oversight",
+        "Policies, MLRO oversight and compliance with ML/TF obligations.",
+        ("comply", "legislation", "compliance officer", "mlro",
+         "technical standards", "unlicensed", "unregulated", "governance"),
+    ),
+)
+
+
+class CoverageMatrix:
+    """Sparse risk x control coverage matrix with query helpers."""
+
+    def __init__(self, risks, controls, entries):
+        self.risks = list(risks)
+        self.controls = list(controls)
+        self._risk_index = {}
+        # (sector prefix, rating) -> row indices, so sector/rating queries
+        # never re-run the RiskID and score regexes
+        self._rows_by_key = defaultdict(list)
+        for i, risk in enumerate(self.risks):
+            if risk.risk_id in self._risk_index:
+                raise ValueError(f"Duplicate RiskID: {risk.risk_id}")
+            self._risk_index[risk.risk_id] = i
+            self._rows_by_key[risk.sector_prefix, risk.rating].append(i)
+        self._control_index = {c.control_id: j for j, c in enumerate(self.controls)}
+        self.matrix = SparseBoolMatrix(len(self.risks), len(self.controls), entries)
+
+    @classmethod
+    def from_pairs(cls, risks, controls, pairs):
+        """Build from (risk_id, control_id) pairs."""
+        risks, controls = list(risks), list(controls)
+        risk_index = {risk.risk_id: i for i, risk in enumerate(risks)}
+        control_index = {c.control_id: j for j, c in enumerate(controls)}
+        entries = []
+        for risk_id, control_id in pairs:
+            if risk_id not in risk_index:
+                raise KeyError(f"Unknown RiskID: {risk_id}")
+            if control_id not in control_index:
+                raise KeyError(f"Unknown control: {control_id}")
+            entries.append((risk_index[risk_id], control_index[control_id]))
+        return cls(risks, controls, entries)
+
+    @classmethod
+    def from_keywords(cls, risks, controls=DEFAULT_CONTROLS):
+        """Build by matching each control's keywords against risk text."""
+        risks, controls = list(risks), list(controls)
+        entries = []
+        for i, risk in enumerate(risks):
+            text = risk_text(risk)
+            entries.extend(
+                (i, j) for j, control in enumerate(controls) if control.matches(text)
+            )
+        return cls(risks, controls, entries)
+
+    def controls_for(self, risk_id):
+        """Controls mitigating a risk."""
+        i = self._risk_index[risk_id]
+        return [self.controls[j] for j in self.matrix.row(i)]
+
+    def risks_for(self, control_id):
+        """Risks mitigated by a control."""
+        j = self._control_index[control_id]
+        return [self.risks[i] for i in self.matrix.col(j)]
+
+    def uncovered_risks(self):
+        """Risks no control in the catalogue mitigates."""
+        counts = self.matrix.row_counts()
+        return [risk for risk, n in zip(self.risks, counts) if n == 0]
+
+    def uncovered_if_failed(self, control_ids):
+        """Risks left with no working control if the given controls fail.
+
+        Only risks reachable from the failed columns are inspected, so the
+        cost is proportional to the nonzeros touched, not the library size.
+        """
+        if isinstance(control_ids, str):
+            control_ids = [control_ids]
+        failed = {self._control_index[c] for c in control_ids}
+        exposed = set()
+        for j in failed:
+            for i in self.matrix.col(j):
+                if i in exposed:
+                    continue
+                if all(k in failed for k in self.matrix.row(i)):
+                    exposed.add(i)
+        return [self.risks[i] for i in sorted(exposed)]
+
+    def minimum_control_set(self, risk_ids=None, sector_prefix=None, rating=None):
+        """Greedy set cover over the selected risks.
+
+        Risks are either given explicitly or chosen by sector prefix and
+        rating (e.g. ``sector_prefix="RBet", rating="High"``). Returns
+        ``(controls, uncoverable_risks)`` where controls are in pick order.
+        """
+        if risk_ids is None:
+            check_filters(sector_prefix, rating)
+            rows = [
+                i
+                for (prefix, risk_rating), indices in self._rows_by_key.items()
+                if sector_prefix in (None, prefix) and rating in (None, risk_rating)
+                for i in indices
+            ]
+        else:
+            rows = [self._risk_index[risk_id] for risk_id in risk_ids]
+        return self._greedy_cover(set(rows))
+
+    def _greedy_cover(self, rows):
+        matrix = self.matrix
+        uncovered = set(rows)
+        gain = [0] * matrix.n_cols
+        for i in uncovered:
+            for j in matrix.row(i):
+                gain[j] += 1
+        unreachable = {i for i in uncovered if not matrix.row(i)}
+        uncovered -= unreachable
+
+        # Lazy greedy: heap entries may be stale; re-check gain on pop.
+        heap = [(-g, j) for j, g in enumerate(gain) if g]
+        heapq.heapify(heap)
+        chosen = []
+        while uncovered and heap:
+            neg, j = heapq.heappop(heap)
+            if -neg != gain[j]:
+                if gain[j]:
+                    heapq.heappush(heap, (-gain[j], j))
+                continue
+            chosen.append(self.controls[j])
+            for i in matrix.col(j):
+                if i in uncovered:
+                    uncovered.discard(i)
+                    for k in matrix.row(i):
+                        gain[k] -= 1
+        return chosen, [self.risks[i] for i in sorted(unreachable)]
@@ -0,0 +1,121 @@
+"""Risk library loaded from the UKGC 2023 risk tracker CSV."""
+
+import csv
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_TRACKER = REPO_ROOT / "docs" / "Risk tracker" / "Risk tracker.csv"
+
+# RiskIDs follow <SECTOR>-<CATEGORY>-<NNN>, e.g. RBet-CV-003
+SECTOR_PREFIXES = {
+    "RB": "Remote Bingo",
+    "NRB": "Non-Remote Bingo",
+    "RC": "Remote Casino",
+    "NRC": "Non-Remote Casino",
+    "RBet": "Remote Betting",
+    "OCB": "Off-Course Betting",
+    "ONC": "On-Course Betting",
+    "AGC": "Adult Gaming Centres",
+    "FEC": "Family Entertainment Centres",
+    "SL": "Society Lotteries",
+    "NL": "National Lottery",
+    "GS": "Gambling Software",
+    "GMT": "Gaming Machine Technical",
+}
+
+RATINGS = ("Low", "Medium", "High")
+
+_RISK_ID = re.compile(r"^([A-Za-z]+)-([A-Z]+)-(\d+)$")
+_SCORES = re.compile(
+    r"Likelihood:\s*(\w+),?\s*Impact:\s*(\w+),?\s*Overall:\s*(\d+)"
+)
+
+
+def parse_risk_id(risk_id):
+    """Split a RiskID into (sector prefix, category code, number)."""
+    match = _RISK_ID.match(risk_id.strip())
+    if not match:
+        raise ValueError(f"Malformed RiskID: {risk_id!r}")
+    prefix, category, number = match.groups()
+    return prefix, category, int(number)
+
+
+def check_filters(sector_prefix=None, rating=None):
+    """Reject an unknown sector prefix or rating used as a query filter."""
+    if sector_prefix is not None and sector_prefix not in SECTOR_PREFIXES:
+        raise ValueError(f"Unknown sector prefix: {sector_prefix!r}")
+    if rating is not None and rating not in RATINGS:
+        raise ValueError(f"Unknown rating: {rating!r}")
+
+
+def rating_for_score(overall):
+    """Band an overall likelihood x impact score (1-9) into Low/Medium/High."""
+    if overall >= 6:
+        return "High"
+    if overall >= 3:
+        return "Medium"
+    return "Low"
+
+
+@dataclass(frozen=True)
+class Risk:
+    """A single row of the risk tracker."""
+
+    risk_id: str
+    title: str
+    description: str
+    applicable_sectors: str
+    source_reference: str
+
+    @property
+    def sector_prefix(self):
+        return parse_risk_id(self.risk_id)[0]
+
+    @property
+    def category(self):
+        return parse_risk_id(self.risk_id)[1]
+
+    @property
+    def scores(self):
+        """(likelihood, impact, overall) from the description, or None."""
+        match = _SCORES.search(self.description)
+        if not match:
+            return None
+        likelihood, impact, overall = match.groups()
+        return likelihood, impact, int(overall)
+
+    @property
+    def rating(self):
+        scores = self.scores
+        return rating_for_score(scores[2]) if scores else None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            risk_id=row["RiskID"].strip(),
+            title=row["RiskTitle"].strip(),
+            description=row["RiskDescription"].strip(),
+            applicable_sectors=row.get("ApplicableSectors", "").strip(),
+            source_reference=row.get("SourceReference", "").strip(),
+        )
+
+
+def load_risks(path=DEFAULT_TRACKER):
+    """Load every risk from a tracker CSV, in file order."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        return [Risk.from_row(row) for row in csv.DictReader(handle)]
+
+
+def filter_risks(risks, sector_prefix=None, rating=None):
+    """Select risks by RiskID sector prefix (e.g. "RBet") and/or rating."""
+    check_filters(sector_prefix, rating)
+    selected = []
+    for risk in risks:
+        if sector_prefix is not None and risk.sector_prefix != sector_prefix:
+            continue
+        if rating is not None and risk.rating != rating:
+            continue
+        selected.append(risk)
+    return selected
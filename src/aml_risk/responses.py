@@ -0,0 +1,70 @@
+"""Assessment responses: the four answer options and per-operator response sets."""
+
+from dataclasses import dataclass, field
+
+from .library import RATINGS
+
+YES_NO_MITIGATION = "yes_no_mitigation"
+YES_MITIGATED = "yes_mitigated"
+NO_EXISTING_MITIGATION = "no_existing_mitigation"
+NO_CONTROLS = "no_controls"
+
+# "Does this risk affect your operations?"
+RESPONSE_OPTIONS = {
+    YES_NO_MITIGATION: "Yes, it does and doesn't need mitigation",
+    YES_MITIGATED: "Yes, and mitigation is in place",
+    NO_EXISTING_MITIGATION: "No, it doesn't because of existing mitigation",
+    NO_CONTROLS: "No, it doesn't and we ensure this through controls",
+}
+
+MITIGATION_SOURCES = ("Internal", "External")
+
+# Options 2 and 3 ask whether the mitigation is Internal or External
+SOURCED_OPTIONS = (YES_MITIGATED, NO_EXISTING_MITIGATION)
+
+
+def residual_rating(inherent, option):
+    """Residual rating of a risk after the operator's answer.
+
+    Unmitigated risks keep their inherent rating, mitigated ones drop one
+    band, and risks the operator does not face are Low.
+    """
+    if option not in RESPONSE_OPTIONS:
+        raise ValueError(f"Unknown response option: {option!r}")
+    if inherent is None:
+        return None
+    if option == YES_NO_MITIGATION:
+        return inherent
+    if option == YES_MITIGATED:
+        return RATINGS[max(RATINGS.index(inherent) - 1, 0)]
+    return "Low"
+
+
+@dataclass(frozen=True)
+class Answer:
+    """One operator's answer to one risk."""
+
+    risk_id: str
+    option: str
+    mitigation_source: str = None
+    description: str = ""
+
+    def __post_init__(self):
+        if self.option not in RESPONSE_OPTIONS:
+            raise ValueError(f"Unknown response option: {self.option!r}")
+        if self.option in SOURCED_OPTIONS:
+            if self.mitigation_source not in MITIGATION_SOURCES:
+                raise ValueError(
+                    f"{self.option!r} needs a mitigation source from "
+                    f"{MITIGATION_SOURCES}, got {self.mitigation_source!r}"
+                )
+        elif self.mitigation_source is not None:
+            raise ValueError(f"{self.option!r} takes no mitigation source")
+
+
+@dataclass
+class ResponseSet:
+    """All answers recorded by one operator, keyed by RiskID."""
+
+    operator_id: str
+    answers: dict = field(default_factory=dict)
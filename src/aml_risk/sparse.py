@@ -0,0 +1,53 @@
+"""Compressed sparse boolean matrix used for risk x control coverage.
+
+Stored twice, row-compressed (CSR) and column-compressed (CSC), so that both
+"controls mitigating risk i" and "risks mitigated by control j" are slices.
+Only the standard library is used, matching the rest of the project.
+"""
+
+from array import array
+
+
+class SparseBoolMatrix:
+    """Immutable sparse 0/1 matrix with CSR and CSC index arrays."""
+
+    def __init__(self, n_rows, n_cols, entries):
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        pairs = sorted(set(entries))
+        for row, col in pairs:
+            if not (0 <= row < n_rows and 0 <= col < n_cols):
+                raise IndexError(f"Entry ({row}, {col}) outside {n_rows}x{n_cols}")
+        self.row_ptr, self.col_idx = _compress(n_rows, pairs)
+        self.col_ptr, self.row_idx = _compress(
+            n_cols, sorted((col, row) for row, col in pairs)
+        )
+
+    @property
+    def nnz(self):
+        return len(self.col_idx)
+
+    def row(self, i):
+        """Column indices set in row i."""
+        return self.col_idx[self.row_ptr[i]:self.row_ptr[i + 1]]
+
+    def col(self, j):
+        """Row indices set in column j."""
+        return self.row_idx[self.col_ptr[j]:self.col_ptr[j + 1]]
+
+    def row_counts(self):
+        return array("l", (self.row_ptr[i + 1] - self.row_ptr[i] for i in range(self.n_rows)))
+
+    def col_counts(self):
+        return array("l", (self.col_ptr[j + 1] - self.col_ptr[j] for j in range(self.n_cols)))
+
+
+def _compress(n_outer, pairs):
+    """Build (pointer, index) arrays from (outer, inner) pairs sorted by outer."""
+    ptr = array("l", [0] * (n_outer + 1))
+    idx = array("l", (inner for _, inner in pairs))
+    for outer, _ in pairs:
+        ptr[outer + 1] += 1
+    for k in range(n_outer):
+        ptr[k + 1] += ptr[k]
+    return ptr, idx
@@ -0,0 +1,145 @@
+import random
+from collections import Counter, defaultdict
+
+import pytest
+
+from aml_risk.analytics import TF_RISK_IDS, PortfolioAnalytics
+from aml_risk.library import load_risks
+from aml_risk.responses import (
+    MITIGATION_SOURCES,
+    RESPONSE_OPTIONS,
+    SOURCED_OPTIONS,
+    YES_NO_MITIGATION,
+    Answer,
+    residual_rating,
+)
+
+
+def _random_answer(rng, risk_id):
+    option = rng.choice(list(RESPONSE_OPTIONS))
+    source = rng.choice(MITIGATION_SOURCES) if option in SOURCED_OPTIONS else None
+    return Answer(risk_id, option, source)
+
+
+def _recount(analytics):
+    """Rebuild every rollup by scanning the stored response sets."""
+    by_option = Counter()
+    by_sector = defaultdict(Counter)
+    by_risk = defaultdict(Counter)
+    by_sector_risk = defaultdict(Counter)
+    residual = defaultdict(set)
+    for operator_id, response_set in analytics.response_sets.items():
+        for answer in response_set.answers.values():
+            risk = analytics.risks[answer.risk_id]
+            by_option[answer.option] += 1
+            by_sector[risk.sector_prefix][answer.option] += 1
+            by_risk[answer.option][answer.risk_id] += 1
+            by_sector_risk[answer.option, risk.sector_prefix][answer.risk_id] += 1
+            rating = residual_rating(risk.rating, answer.option)
+            residual[rating, risk.sector_prefix, answer.risk_id].add(operator_id)
+    return by_option, by_sector, by_risk, by_sector_risk, residual
+
+
+def _nonempty(rollup):
+    return {key: counter for key, counter in rollup.items() if counter}
+
+
+def test_rollups_match_full_recount():
+    rng = random.Random(27)
+    risks = load_risks()
+    risk_ids = [risk.risk_id for risk in risks]
+    analytics = PortfolioAnalytics(risks)
+    operators = [f"OP-{n}" for n in range(12)]
+
+    for _ in range(4000):
+        roll = rng.random()
+        operator_id = rng.choice(operators)
+        stored = analytics.response_sets.get(operator_id)
+        if roll < 0.8:
+            analytics.record_answer(operator_id, _random_answer(rng, rng.choice(risk_ids)))
+        elif roll < 0.97 and stored and stored.answers:
+            analytics.remove_answer(operator_id, rng.choice(list(stored.answers)))
+        elif stored:
+            analytics.remove_operator(operator_id)
+
+    by_option, by_sector, by_risk, by_sector_risk, residual = _recount(analytics)
+    assert analytics.by_option == by_option
+    assert _nonempty(analytics.by_sector) == by_sector
+    assert _nonempty(analytics.by_risk) == by_risk
+    assert _nonempty(analytics.by_sector_risk) == by_sector_risk
+    flattened = {
+        (rating, prefix, risk_id): operator_ids
+        for rating, by_prefix in analytics.residual.items()
+        for prefix, by_risk_id in by_prefix.items()
+        for risk_id, operator_ids in by_risk_id.items()
+    }
+    assert flattened == dict(residual)
+
+
+def test_overwrite_replaces_previous_answer():
+    analytics = PortfolioAnalytics(load_risks())
+    analytics.record_answer("OP-1", Answer("RB-OC-001", YES_NO_MITIGATION))
+    analytics.record_answer("OP-1", Answer("RB-OC-001", "yes_mitigated", "Internal"))
+    assert analytics.by_option == Counter({"yes_mitigated": 1})
+    assert analytics.operators_with_residual("High") == {}
+    assert analytics.operators_with_residual("Medium") == {"OP-1": ["RB-OC-001"]}
+
+
+def test_queries_filter_by_sector_prefix_and_tf():
+    analytics = PortfolioAnalytics(load_risks())
+    for operator_id in ("OP-1", "OP-2"):
+        analytics.record_answer(operator_id, Answer("RBet-OC-001", YES_NO_MITIGATION))
+    analytics.record_answer("OP-3", Answer("RB-OC-003", YES_NO_MITIGATION))
+    analytics.record_answer("OP-3", Answer("NRC-OC-001", YES_NO_MITIGATION))
+    analytics.record_answer("OP-2", Answer("RBet-MP-002", YES_NO_MITIGATION))
+    analytics.record_answer("OP-3", Answer("RC-MP-005", YES_NO_MITIGATION))
+
+    assert analytics.most_common_risks(YES_NO_MITIGATION, 1) == [("RBet-OC-001", 2)]
+    assert analytics.most_common_risks(YES_NO_MITIGATION, sector_prefix="NRC") == [
+        ("NRC-OC-001", 1)
+    ]
+    assert analytics.most_common_risks("no_controls", sector_prefix="RB") == []
+    assert analytics.option_counts("RBet") == Counter({YES_NO_MITIGATION: 3})
+
+    # Generic "failing to comply with ML/TF legislation" rows are not TF risks
+    assert analytics.operators_with_residual("High", terrorist_financing=True) == {
+        "OP-2": ["RBet-MP-002"],
+        "OP-3": ["RC-MP-005"],
+    }
+    assert analytics.operators_with_residual(
+        "High", sector_prefix="RBet", terrorist_financing=True
+    ) == {"OP-2": ["RBet-MP-002"]}
+    assert analytics.operators_with_residual("High", sector_prefix="RB") == {
+        "OP-3": ["RB-OC-003"]
+    }
+
+
+def test_rejects_unknown_risk_and_missing_answers():
+    analytics = PortfolioAnalytics(load_risks())
+    with pytest.raises(KeyError):
+        analytics.record_answer("OP-1", Answer("XX-OC-001", YES_NO_MITIGATION))
+    with pytest.raises(KeyError):
+        analytics.remove_answer("OP-1", "RB-OC-001")
+    with pytest.raises(KeyError, match="OP-9"):
+        analytics.remove_operator("OP-9")
+    with pytest.raises(ValueError):
+        analytics.most_common_risks("maybe")
+    with pytest.raises(ValueError):
+        analytics.most_common_risks(YES_NO_MITIGATION, sector_prefix="Rbet")
+    with pytest.raises(ValueError):
+        analytics.operators_with_residual("Severe")
+
+
+def test_tf_classification_uses_tracker_ids():
+    risk_ids = {risk.risk_id for risk in load_risks()}
+    assert TF_RISK_IDS <= risk_ids
+    assert not {risk_id for risk_id in TF_RISK_IDS if risk_id.endswith("-OC-001")}
+
+
+def test_custom_tf_classification():
+    analytics = PortfolioAnalytics(load_risks(), tf_risk_ids={"RB-OC-003"})
+    analytics.record_answer("OP-1", Answer("RB-OC-003", YES_NO_MITIGATION))
+    analytics.record_answer("OP-1", Answer("RC-MP-005", YES_NO_MITIGATION))
+    assert analytics.operators_with_residual("High", terrorist_financing=True) == {
+        "OP-1": ["RB-OC-003"]
+    }
@@ -0,0 +1,94 @@
+import pytest
+
+from aml_risk.compact import CompactLibrary, CompactPortfolio, PackedResponses
+from aml_risk.library import Risk, load_risks
+from aml_risk.responses import (
+    NO_CONTROLS,
+    NO_EXISTING_MITIGATION,
+    YES_MITIGATED,
+    YES_NO_MITIGATION,
+    Answer,
+)
+
+
+def test_library_round_trips_tracker():
+    risks = load_risks()
+    library = CompactLibrary(risks)
+    assert len(library) == len(risks)
+    assert [library.risk(i) for i in range(len(library))] == risks
+    assert [library.risk_ids[i] for i in library.ordinals_for_prefix("GS")] == [
+        "GS-OC-001", "GS-OC-002", "GS-OC-003",
+    ]
+
+
+def test_library_beyond_16_bit_string_table():
+    risks = [
+        Risk(f"RB-OC-{i}", f"Title {i}", f"Description {i}", "Bingo", "UKGC")
+        for i in range(70_000)
+    ]
+    risks.append(Risk("RC-PV-1", "t", "d", "Casino Remote", "UKGC remote casino"))
+    library = CompactLibrary(risks)
+    assert library.risk(len(risks) - 1) == risks[-1]
+    assert library.risk(69_999) == risks[69_999]
+
+
+def test_library_rejects_duplicate_ids():
+    risk = Risk("RB-OC-001", "t", "d", "Bingo", "src")
+    with pytest.raises(ValueError):
+        CompactLibrary([risk, risk])
+
+
+@pytest.mark.parametrize("ordinal", range(8))
+def test_packing_round_trip_at_each_bit_offset(ordinal):
+    packed = PackedResponses(9)
+    neighbours = [o for o in range(9) if o != ordinal]
+    for o in neighbours:
+        packed.set(o, NO_EXISTING_MITIGATION, "External")
+
+    packed.set(ordinal, YES_MITIGATED, "Internal", "note")
+    assert packed.get(ordinal) == (YES_MITIGATED, "Internal", "note")
+    packed.set(ordinal, NO_CONTROLS)
+    assert packed.get(ordinal) == (NO_CONTROLS, None, "")
+    assert not packed.descriptions
+
+    packed.set(ordinal, YES_NO_MITIGATION, None, "kept")
+    packed.clear(ordinal)
+    assert packed.get(ordinal) is None
+    assert ordinal not in packed.descriptions
+    for o in neighbours:
+        assert packed.get(o) == (NO_EXISTING_MITIGATION, "External", "")
+    assert list(packed.answered()) == neighbours
+
+
+def test_portfolio_round_trip_and_removal():
+    portfolio = CompactPortfolio(CompactLibrary(load_risks()))
+    first = Answer("RB-OC-002", YES_MITIGATED, "External", "note")
+    second = Answer("RB-OC-003", NO_CONTROLS)
+    portfolio.record_answer("OP-1", first)
+    portfolio.record_answer("OP-1", second)
+    assert portfolio.answer("OP-1", "RB-OC-002") == first
+    assert list(portfolio.answers("OP-1")) == [first, second]
+
+    portfolio.remove_answer("OP-1", "RB-OC-002")
+    assert portfolio.answer("OP-1", "RB-OC-002") is None
+    assert list(portfolio.answers("OP-1")) == [second]
+    with pytest.raises(KeyError):
+        portfolio.remove_answer("OP-1", "RB-OC-002")
+
+    portfolio.remove_operator("OP-1")
+    assert portfolio.answer("OP-1", "RB-OC-003") is None
+    assert list(portfolio.answers("OP-1")) == []
+    with pytest.raises(KeyError, match="OP-1"):
+        portfolio.remove_operator("OP-1")
+
+
+def test_invalid_inputs_rejected():
+    packed = PackedResponses(4)
+    with pytest.raises(KeyError):
+        packed.set(1, YES_MITIGATED, "Elsewhere")
+    assert packed.get(1) is None
+
+    portfolio = CompactPortfolio(CompactLibrary(load_risks()))
+    with pytest.raises(TypeError):
+        portfolio.record_answer("OP-1", ("RB-OC-001", YES_NO_MITIGATION))
+    assert list(portfolio.answers("OP-1")) == []
@@ -0,0 +1,150 @@
+import random
+
+import pytest
+
+from aml_risk.controls import DEFAULT_CONTROLS, Control, CoverageMatrix, risk_text
+from aml_risk.library import Risk, load_risks
+
+
+def _risk(risk_id, title="t", description="(Likelihood: High Impact: High Overall: 9)"):
+    return Risk(risk_id, title, description, "Bingo", "src")
+
+
+def _controls(n):
+    return [Control(f"C{j}", f"Control {j}", "") for j in range(n)]
+
+
+@pytest.fixture
+def small():
+    risks = [_risk(f"RB-OC-{i:03d}") for i in range(1, 6)]
+    pairs = [
+        ("RB-OC-001", "C0"),
+        ("RB-OC-002", "C0"), ("RB-OC-002", "C1"),
+        ("RB-OC-003", "C1"), ("RB-OC-003", "C2"),
+        ("RB-OC-004", "C2"),
+        # RB-OC-005 has no controls
+    ]
+    return CoverageMatrix.from_pairs(risks, _controls(3), pairs)
+
+
+def _ids(risks):
+    return [risk.risk_id for risk in risks]
+
+
+def test_from_pairs_rejects_unknown_ids():
+    with pytest.raises(KeyError):
+        CoverageMatrix.from_pairs([_risk("RB-OC-001")], _controls(1), [("RB-OC-009", "C0")])
+    with pytest.raises(KeyError):
+        CoverageMatrix.from_pairs([_risk("RB-OC-001")], _controls(1), [("RB-OC-001", "C9")])
+
+
+def test_uncovered_risks(small):
+    assert _ids(small.uncovered_risks()) == ["RB-OC-005"]
+
+
+def test_uncovered_if_single_control_fails(small):
+    assert _ids(small.uncovered_if_failed("C0")) == ["RB-OC-001"]
+    assert _ids(small.uncovered_if_failed("C1")) == []
+
+
+def test_uncovered_if_multiple_controls_fail(small):
+    assert _ids(small.uncovered_if_failed(["C0", "C1"])) == ["RB-OC-001", "RB-OC-002"]
+    assert _ids(small.uncovered_if_failed(["C1", "C2"])) == ["RB-OC-003", "RB-OC-004"]
+    # Risks without controls are never reported as newly uncovered
+    assert "RB-OC-005" not in _ids(small.uncovered_if_failed(["C0", "C1", "C2"]))
+
+
+def test_minimum_control_set_reports_unreachable(small):
+    chosen, unreachable = small.minimum_control_set(
+        risk_ids=["RB-OC-001", "RB-OC-003", "RB-OC-004", "RB-OC-005"]
+    )
+    assert [c.control_id for c in chosen] == ["C2", "C0"]
+    assert _ids(unreachable) == ["RB-OC-005"]
+
+
+def test_greedy_cover_covers_every_reachable_target():
+    rng = random.Random(7)
+    risks = [_risk(f"RB-OC-{i:04d}") for i in range(400)]
+    controls = _controls(60)
+    pairs = [
+        (risk.risk_id, f"C{rng.randrange(60)}")
+        for risk in risks[:380]
+        for _ in range(rng.randint(1, 4))
+    ]
+    matrix = CoverageMatrix.from_pairs(risks, controls, pairs)
+    targets = _ids(risks)
+    chosen, unreachable = matrix.minimum_control_set(risk_ids=targets)
+
+    chosen_ids = {c.control_id for c in chosen}
+    assert len(chosen_ids) == len(chosen)
+    covered = {
+        risk_id for risk_id in targets
+        if {c.control_id for c in matrix.controls_for(risk_id)} & chosen_ids
+    }
+    assert _ids(unreachable) == targets[380:]
+    assert covered == set(targets[:380])
+    # Greedy never picks a control that adds nothing
+    seen = set()
+    for control in chosen:
+        new = set(_ids(matrix.risks_for(control.control_id))) - seen
+        assert new
+        seen |= new
+
+
+def test_minimum_control_set_filters_by_sector_and_rating():
+    risks = [
+        _risk("RB-OC-001"),
+        _risk("RB-OC-002", description="(Likelihood: Low Impact: Low Overall: 1)"),
+        _risk("RC-OC-001"),
+    ]
+    pairs = [("RB-OC-001", "C0"), ("RB-OC-002", "C1"), ("RC-OC-001", "C2")]
+    matrix = CoverageMatrix.from_pairs(risks, _controls(3), pairs)
+    chosen, unreachable = matrix.minimum_control_set(sector_prefix="RB", rating="High")
+    assert [c.control_id for c in chosen] == ["C0"]
+    assert unreachable == []
+
+
+def test_keyword_matching_uses_lowercased_text():
+    control = Control("CTL-KYC", "KYC", "", ("kyc",))
+    assert control.matches(risk_text(_risk("RB-OC-001", title="Inadequate KYC checks")))
+    assert not control.matches(risk_text(_risk("RB-OC-002", title="Cash")))
+
+
+def test_default_catalogue_covers_tracker():
+    matrix = CoverageMatrix.from_keywords(load_risks())
+    assert matrix.uncovered_risks() == []
+    assert {c.control_id for c in matrix.controls_for("RB-OC-004")} >= {"CTL-KYC"}
+
+
+@pytest.mark.parametrize("title, control_id", [
+    ("Patrons discarding winnings receipts", "CTL-TXM"),  # "atr" in "patrons"
+    ("Patrons discarding winnings receipts", "CTL-PAY"),  # "card" in "discarding"
+    ("Staff denotes peppered entries", "CTL-TXM"),  # "notes" in "denotes"
+    ("Staff denotes peppered entries", "CTL-PEP"),  # "pep" in "peppered"
+])
+def test_keyword_inside_longer_word_does_not_match(title, control_id):
+    matrix = CoverageMatrix.from_keywords([_risk("RB-OC-001", title=title)])
+    assert control_id not in {c.control_id for c in matrix.controls_for("RB-OC-001")}
+
+
+def test_keywords_match_plurals_and_stems():
+    txm, pep = (
+        next(c for c in DEFAULT_CONTROLS if c.control_id == cid)
+        for cid in ("CTL-TXM", "CTL-PEP")
+    )
+    assert pep.matches("foreign peps")
+    assert pep.matches("sanctioned customers")
+    assert txm.matches("structuring deposits")
+    assert txm.matches("atr machines")
+
+
+def test_duplicate_risk_ids_rejected():
+    with pytest.raises(ValueError):
+        CoverageMatrix([_risk("RB-OC-001"), _risk("RB-OC-001")], _controls(1), [])
+
+
+def test_unknown_sector_prefix_or_rating_rejected(small):
+    with pytest.raises(ValueError):
+        small.minimum_control_set(sector_prefix="Rbet")
+    with pytest.raises(ValueError):
+        small.minimum_control_set(rating="Severe")
@@ -0,0 +1,40 @@
+import pytest
+
+from aml_risk.responses import (
+    NO_CONTROLS,
+    NO_EXISTING_MITIGATION,
+    YES_MITIGATED,
+    YES_NO_MITIGATION,
+    Answer,
+    residual_rating,
+)
+
+
+@pytest.mark.parametrize("option", [YES_MITIGATED, NO_EXISTING_MITIGATION])
+def test_mitigated_options_need_source(option):
+    assert Answer("RB-OC-001", option, "Internal").mitigation_source == "Internal"
+    assert Answer("RB-OC-001", option, "External").mitigation_source == "External"
+    with pytest.raises(ValueError):
+        Answer("RB-OC-001", option)
+    with pytest.raises(ValueError):
+        Answer("RB-OC-001", option, "Elsewhere")
+
+
+@pytest.mark.parametrize("option", [YES_NO_MITIGATION, NO_CONTROLS])
+def test_other_options_take_no_source(option):
+    assert Answer("RB-OC-001", option).mitigation_source is None
+    with pytest.raises(ValueError):
+        Answer("RB-OC-001", option, "Internal")
+
+
+def test_unknown_option_rejected():
+    with pytest.raises(ValueError):
+        Answer("RB-OC-001", "maybe")
+
+
+def test_residual_rating():
+    assert residual_rating("High", YES_NO_MITIGATION) == "High"
+    assert residual_rating("High", YES_MITIGATED) == "Medium"
+    assert residual_rating("Low", YES_MITIGATED) == "Low"
+    assert residual_rating("High", NO_CONTROLS) == "Low"
+    assert residual_rating(None, YES_NO_MITIGATION) is None
@@ -0,0 +1,31 @@
+import pytest
+
+from aml_risk.sparse import SparseBoolMatrix
+
+
+def test_csr_and_csc_agree():
+    entries = [(0, 2), (2, 0), (0, 0), (1, 2), (2, 0)]  # duplicate (2, 0)
+    m = SparseBoolMatrix(4, 3, entries)
+    assert m.nnz == 4
+    assert list(m.row_ptr) == [0, 2, 3, 4, 4]
+    assert list(m.row(0)) == [0, 2]
+    assert list(m.row(1)) == [2]
+    assert list(m.row(3)) == []
+    assert list(m.col_ptr) == [0, 2, 2, 4]
+    assert list(m.col(0)) == [0, 2]
+    assert list(m.col(1)) == []
+    assert list(m.col(2)) == [0, 1]
+    assert list(m.row_counts()) == [2, 1, 1, 0]
+    assert list(m.col_counts()) == [2, 0, 2]
+
+
+def test_empty_matrix():
+    m = SparseBoolMatrix(2, 2, [])
+    assert m.nnz == 0
+    assert list(m.row(1)) == [] and list(m.col(1)) == []
+
+
+@pytest.mark.parametrize("entry", [(3, 0), (0, 2), (-1, 0), (0, -1)])
+def test_out_of_range_entry_rejected(entry):
+    with pytest.raises(IndexError):
+        SparseBoolMatrix(3, 2, [entry])